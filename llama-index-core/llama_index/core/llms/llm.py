@@ -213,6 +213,9 @@ class LLM(BaseLLM):
     def _log_template_data(
         self, prompt: BasePromptTemplate, **prompt_args: Any
     ) -> None:
+        if not self.callback_manager.handlers:
+            return
+
         template_vars = {
             k: v
             for k, v in ChainMap(prompt.kwargs, prompt_args).items()
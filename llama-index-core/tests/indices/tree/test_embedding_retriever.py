@@ -1,6 +1,5 @@
 """Test embedding functionalities."""
 
-from collections import defaultdict
 from typing import Any, Dict, List
 from unittest.mock import patch
 
@@ -40,21 +39,19 @@ def documents() -> List[Document]:
     return [Document(text=doc_text)]
 
 
+_TEXT_SIMILARITY_MAP = {
+    "Hello world.": 0.9,
+    "This is a test.": 0.8,
+    "This is another test.": 0.7,
+    "This is a test v2.": 0.6,
+}
+
+
 def _get_node_text_embedding_similarities(
     query_embedding: List[float], nodes: List[BaseNode]
 ) -> List[float]:
     """Get node text embedding similarity."""
-    text_similarity_map = defaultdict(lambda: 0.0)
-    text_similarity_map["Hello world."] = 0.9
-    text_similarity_map["This is a test."] = 0.8
-    text_similarity_map["This is another test."] = 0.7
-    text_similarity_map["This is a test v2."] = 0.6
-
-    similarities = []
-    for node in nodes:
-        similarities.append(text_similarity_map[node.get_content()])
-
-    return similarities
+    return [_TEXT_SIMILARITY_MAP.get(node.get_content(), 0.0) for node in nodes]
 
 
 @patch.object(
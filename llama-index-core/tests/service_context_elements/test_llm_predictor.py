@@ -0,0 +1,41 @@
+from typing import Callable, Union
+from unittest.mock import patch
+
+import pytest
+from llama_index.core.callbacks import CallbackManager, LlamaDebugHandler
+from llama_index.core.callbacks.schema import CBEventType, EventPayload
+from llama_index.core.llms.mock import MockLLM
+from llama_index.core.prompts import PromptTemplate
+from llama_index.core.service_context_elements.llm_predictor import LLMPredictor
+
+TEST_PROMPT = PromptTemplate("Tell me about {topic}.")
+
+
+@pytest.mark.parametrize(
+    "predictor_factory",
+    [
+        lambda cm: LLMPredictor(llm=MockLLM(), callback_manager=cm),
+        lambda cm: MockLLM(callback_manager=cm),
+    ],
+    ids=["llm_predictor", "llm"],
+)
+def test_predict_templating_event(
+    predictor_factory: Callable[[CallbackManager], Union[LLMPredictor, MockLLM]],
+) -> None:
+    """Test that predict only emits a templating event when handlers exist."""
+    predictor = predictor_factory(CallbackManager([]))
+    with patch.object(CallbackManager, "on_event_start") as mock_event_start:
+        predictor.predict(TEST_PROMPT, topic="cats")
+    event_types = [call.args[0] for call in mock_event_start.call_args_list]
+    assert CBEventType.TEMPLATING not in event_types
+
+    handler = LlamaDebugHandler()
+    predictor = predictor_factory(CallbackManager([handler]))
+    predictor.predict(TEST_PROMPT, topic="cats")
+
+    events = handler.get_event_pairs(CBEventType.TEMPLATING)
+    assert len(events) == 1
+    payload = events[0][0].payload
+    assert payload is not None
+    assert payload[EventPayload.TEMPLATE] == "Tell me about {topic}."
+    assert payload[EventPayload.TEMPLATE_VARS] == {"topic": "cats"}
@@ -7,22 +7,22 @@ from llama_index.core.tools import BaseTool
 from llama_index.core.types import BaseOutputParser
 
 from .schema import JoinerOutput, LLMCompilerParseResult
+from .utils import ID_PATTERN, default_dependency_rule  # noqa: F401
 from .utils import get_graph_dict
 
-THOUGHT_PATTERN = r"Thought: ([^\n]*)"
-ACTION_PATTERN = r"\n*(\d+)\. (\w+)\((.*)\)(\s*#\w+\n)?"
-# $1 or ${1} -> 1
-ID_PATTERN = r"\$\{?(\d+)\}?"
+THOUGHT_PATTERN = r"Thought: (?P<thought>[^\n]*)"
+ACTION_PATTERN = (
+    r"\n*(?P<idx>\d+)\. (?P<tool_name>\w+)\((?P<args>.*)\)(?P<comment>\s*#\w+\n)?"
+)
 
 END_OF_PLAN = "<END_OF_PLAN>"
 JOINER_REPLAN = "Replan"
 
+_ACTION_PREFIX = "Action:"
+_THOUGHT_PREFIX = "Thought:"
 
-def default_dependency_rule(idx: int, args: str) -> bool:
-    """Default dependency rule."""
-    matches = re.findall(ID_PATTERN, args)
-    numbers = [int(match) for match in matches]
-    return idx in numbers
+_PLAN_RE = re.compile(rf"(?:{THOUGHT_PATTERN}\n)?{ACTION_PATTERN}")
+_ACTION_ONLY_RE = re.compile(ACTION_PATTERN)
 
 
 class LLMCompilerPlanParser(BaseOutputParser):
@@ -39,19 +39,20 @@ class LLMCompilerPlanParser(BaseOutputParser):
     def parse(self, text: str) -> Dict[int, Any]:
         # 1. search("Ronaldo number of kids") -> 1, "search", '"Ronaldo number of kids"'
         # pattern = r"(\d+)\. (\w+)\(([^)]+)\)"
-        pattern = rf"(?:{THOUGHT_PATTERN}\n)?{ACTION_PATTERN}"
-        matches = re.findall(pattern, text)
+
+        # skip the optional thought group entirely if no thoughts were emitted
+        plan_re = _PLAN_RE if _THOUGHT_PREFIX in text else _ACTION_ONLY_RE
 
         # convert matches to a list of LLMCompilerParseResult
-        results: List[LLMCompilerParseResult] = []
-        for match in matches:
-            thought, idx, tool_name, args, _ = match
-            idx = int(idx)
-            results.append(
-                LLMCompilerParseResult(
-                    thought=thought, idx=idx, tool_name=tool_name, args=args
-                )
+        results: List[LLMCompilerParseResult] = [
+            LLMCompilerParseResult(
+                thought=match.groupdict().get("thought") or "",
+                idx=int(match["idx"]),
+                tool_name=match["tool_name"],
+                args=match["args"],
             )
+            for match in plan_re.finditer(text)
+        ]
 
         # get graph dict
         return get_graph_dict(results, self.tools)
@@ -71,11 +72,18 @@ class LLMCompilerJoinerParser(BaseOutputParser):
     def parse(self, text: str) -> JoinerOutput:
         """Parse."""
         thought, answer, is_replan = "", "", False  # default values
-        raw_answers = text.split("\n")
-        for answer in raw_answers:
-            if answer.startswith("Action:"):
-                answer = answer[answer.find("(") + 1 : answer.find(")")]
-                is_replan = JOINER_REPLAN in answer
-            elif answer.startswith("Thought:"):
-                thought = answer.split("Thought:")[1].strip()
+        found_action, found_thought = False, False
+        # scan from the end so the last Thought/Action wins, and stop once
+        # both have been found
+        for ans in reversed(text.splitlines()):
+            if not found_action and ans.startswith(_ACTION_PREFIX):
+                lp = ans.find("(")
+                answer = ans[lp + 1 : ans.find(")", lp + 1)]
+                is_replan = JOINER_REPLAN in ans
+                found_action = True
+            elif not found_thought and ans.startswith(_THOUGHT_PREFIX):
+                thought = ans[len(_THOUGHT_PREFIX) :].strip()
+                found_thought = True
+            if found_action and found_thought:
+                break
         return JoinerOutput(thought=thought, answer=answer, is_replan=is_replan)
@@ -1,12 +1,16 @@
+from dataclasses import dataclass
 from typing import Any, Collection, List, Optional, Tuple, Union
 
 from llama_index.core.tools.types import AsyncBaseTool
 from pydantic import BaseModel
 
 
-class LLMCompilerParseResult(BaseModel):
+@dataclass
+class LLMCompilerParseResult:
     """LLMCompiler parser result."""
 
+    __slots__ = ("thought", "idx", "tool_name", "args")
+
     thought: str
     idx: int
     tool_name: str
@@ -1,7 +1,7 @@
 """Utils for LLM Compiler."""
 import ast
 import re
-from typing import Any, Dict, List, Sequence, Tuple, Union
+from typing import Any, Dict, List, Sequence, Set, Tuple, Union
 
 from llama_index.core.tools.function_tool import FunctionTool
 from llama_index.core.tools.types import BaseTool, adapt_to_async_tool
@@ -13,13 +13,17 @@ from .schema import (
 
 # $1 or ${1} -> 1
 ID_PATTERN = r"\$\{?(\d+)\}?"
+_ID_RE = re.compile(ID_PATTERN)
+
+
+def _get_referenced_ids(args: str) -> Set[int]:
+    """Get the step ids referenced as $N / ${N} in the args string."""
+    return {int(match) for match in _ID_RE.findall(args)}
 
 
 def default_dependency_rule(idx: int, args: str) -> bool:
     """Default dependency rule."""
-    matches = re.findall(ID_PATTERN, args)
-    numbers = [int(match) for match in matches]
-    return idx in numbers
+    return idx in _get_referenced_ids(args)
 
 
 def parse_llm_compiler_action_args(args: str) -> Union[List, Tuple]:
@@ -61,8 +65,10 @@ def _get_dependencies_from_graph(idx: int, tool_name: str, args: str) -> List[in
         # depends on the previous step
         dependencies = list(range(1, idx))
     else:
-        # define dependencies based on the dependency rule in tool_definitions.py
-        dependencies = [i for i in range(1, idx) if default_dependency_rule(i, args)]
+        # depends on every earlier step referenced in the args (same rule as
+        # default_dependency_rule, but the args are scanned only once)
+        referenced_ids = _get_referenced_ids(args)
+        dependencies = [i for i in range(1, idx) if i in referenced_ids]
 
     return dependencies
 
@@ -1,7 +1,100 @@
 from llama_index.core.llama_pack import BaseLlamaPack
+from llama_index.core.tools import FunctionTool
 from llama_index.packs.agents_llm_compiler import LLMCompilerAgentPack
+from llama_index.packs.agents_llm_compiler.output_parser import (
+    LLMCompilerJoinerParser,
+    LLMCompilerPlanParser,
+)
+from llama_index.packs.agents_llm_compiler.utils import (
+    _get_dependencies_from_graph,
+    default_dependency_rule,
+)
 
 
 def test_class():
     names_of_base_classes = [b.__name__ for b in LLMCompilerAgentPack.__mro__]
     assert BaseLlamaPack.__name__ in names_of_base_classes
+
+
+def test_joiner_parser_trailing_newline() -> None:
+    output = LLMCompilerJoinerParser().parse("Thought: t\nAction: Finish(x)\n\n")
+    assert output.thought == "t"
+    assert output.answer == "x"
+    assert not output.is_replan
+
+
+def test_joiner_parser_trailing_non_action_line() -> None:
+    output = LLMCompilerJoinerParser().parse(
+        "Thought: t\nAction: Finish(done)\nsome trailing line"
+    )
+    assert output.answer == "done"
+
+
+def test_joiner_parser_replan() -> None:
+    output = LLMCompilerJoinerParser().parse(
+        "Thought: need more info\nAction: Replan(missing data)"
+    )
+    assert output.thought == "need more info"
+    assert output.answer == "missing data"
+    assert output.is_replan
+
+
+def test_joiner_parser_paren_slicing() -> None:
+    output = LLMCompilerJoinerParser().parse("Thought: t\nAction: Finish(the answer) ")
+    assert output.answer == "the answer"
+    output = LLMCompilerJoinerParser().parse("Thought: t\nAction: Finish()")
+    assert output.answer == ""
+
+
+def test_joiner_parser_last_block_wins() -> None:
+    output = LLMCompilerJoinerParser().parse(
+        "Thought: a\nAction: Replan(no)\nThought: b\nAction: Finish(ok)"
+    )
+    assert output.thought == "b"
+    assert output.answer == "ok"
+    assert not output.is_replan
+
+
+def test_dependencies_from_graph() -> None:
+    assert _get_dependencies_from_graph(4, "add", "$1, ${3}") == [1, 3]
+    assert _get_dependencies_from_graph(2, "search", '"$5"') == []
+    assert _get_dependencies_from_graph(3, "join", "") == [1, 2]
+    assert default_dependency_rule(1, "$1, $2")
+    assert not default_dependency_rule(3, "$1, $2")
+
+
+def _search(query: str) -> str:
+    """Search."""
+    return query
+
+
+PLAN_PARSER = LLMCompilerPlanParser(tools=[FunctionTool.from_defaults(fn=_search)])
+
+
+def test_plan_parser_with_thoughts() -> None:
+    graph = PLAN_PARSER.parse(
+        'Thought: look it up\n1. _search("a (b)")\n'
+        'Thought: again\n2. _search("$1")\n3. join()<END_OF_PLAN>'
+    )
+    assert list(graph) == [1, 2, 3]
+    assert graph[1].thought == "look it up"
+    assert graph[1].args == ("a (b)",)
+    assert graph[2].thought == "again"
+    assert graph[2].dependencies == [1]
+    assert graph[3].thought == ""
+    assert graph[3].is_join
+
+
+def test_plan_parser_without_thoughts() -> None:
+    graph = PLAN_PARSER.parse('1. _search("x")\n2. join()<END_OF_PLAN>')
+    assert list(graph) == [1, 2]
+    assert graph[1].thought == ""
+    assert graph[1].args == ("x",)
+    assert graph[2].is_join
+
+
+def test_plan_parser_thought_without_space() -> None:
+    # "Thought:" without a trailing space is not captured as a thought
+    graph = PLAN_PARSER.parse('Thought:x\n1. _search("x")\n2. join()')
+    assert list(graph) == [1, 2]
+    assert graph[1].thought == ""